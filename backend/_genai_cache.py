@@ -0,0 +1,89 @@
+"""
+Shared Gemini model-discovery cache.
+
+Both diagnose_ai and fix_ai need the set of models that support
+generateContent. list_models() is a remote HTTPS call, so cache the
+result in-process with a short TTL - a combined setup run (config ->
+diagnostics -> fix) then fetches the list exactly once.
+"""
+
+import time
+
+_TTL_SECONDS = 300
+
+# The google.generativeai module, imported lazily exactly once per
+# process - the import alone costs ~200 ms, so callers driven from a
+# single entry point (setup_environment) shouldn't trigger it twice
+_genai = None
+
+def genai():
+    """Return the google.generativeai module, importing it on first use"""
+    global _genai
+    if _genai is None:
+        import google.generativeai
+        _genai = google.generativeai
+    return _genai
+
+# (monotonic timestamp, tuple of model names) from the last fetch
+_cached = None
+
+# GenerativeModel instances by name - constructing one sets up fresh
+# HTTP/TLS plumbing, so repeated probes should share a single instance
+_models = {}
+
+def get_model(name):
+    """Return a cached GenerativeModel for *name*, creating it once"""
+    model = _models.get(name)
+    if model is None:
+        model = genai().GenerativeModel(name)
+        _models[name] = model
+    return model
+
+def generate_models():
+    """Return the names of models that support generateContent.
+
+    The result is cached for a few minutes so sequential callers within
+    one process don't re-issue the network round-trip.
+    """
+    global _cached
+    now = time.monotonic()
+    if _cached is not None and now - _cached[0] < _TTL_SECONDS:
+        return _cached[1]
+
+    names = tuple(m.name for m in genai().list_models()
+                  if 'generateContent' in m.supported_generation_methods)
+    _cached = (now, names)
+    return names
+
+def resolve_candidates(candidates):
+    """Return the subset of *candidates* that support generateContent.
+
+    Candidates may be bare names ('gemini-pro') or prefixed
+    ('models/gemini-pro'). When the full model list isn't already
+    cached, this streams list_models() and stops paginating as soon as
+    every candidate has been resolved.
+    """
+    want = set(candidates)
+    found = set()
+
+    def consume(name):
+        bare = name.rsplit('/', 1)[-1]
+        for candidate in (name, bare):
+            if candidate in want:
+                want.discard(candidate)
+                found.add(candidate)
+
+    if _cached is not None and time.monotonic() - _cached[0] < _TTL_SECONDS:
+        for name in _cached[1]:
+            consume(name)
+            if not want:
+                break
+        return found
+
+    for model in genai().list_models():
+        if 'generateContent' not in model.supported_generation_methods:
+            continue
+        consume(model.name)
+        if not want:
+            break
+    return found
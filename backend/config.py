@@ -6,6 +6,20 @@ This file helps you configure your SkillSync installation.
 
 import os
 
+# Template for new .env files. Kept as module-level bytes so creation is
+# a single os.write with no text-mode codec/newline machinery.
+_ENV_TEMPLATE = b"""# SkillSync AI Configuration
+# Get your free Gemini API key from: https://makersuite.google.com/app/apikey
+
+GEMINI_API_KEY=your_gemini_api_key_here
+
+# Optional: Set environment mode
+ENVIRONMENT=development
+
+# Note: SkillSync works in demo mode without the API key
+# AI features will be simulated with high-quality fallback responses
+"""
+
 def setup_environment():
     """
     Help users set up their environment for SkillSync AI features
@@ -13,14 +27,18 @@ def setup_environment():
     print("🚀 SkillSync AI Configuration Setup")
     print("=" * 50)
     
-    # Check if .env file exists
+    # Create the .env file if needed - O_EXCL inside create_env_file
+    # makes this race-free, so no separate existence check
     env_file = os.path.join(os.path.dirname(__file__), '.env')
-    
-    if not os.path.exists(env_file):
-        print("📝 Creating .env file...")
-        create_env_file(env_file)
-    else:
-        print("✅ .env file already exists")
+    create_env_file(env_file)
+
+    # Refresh the compiled env module so the diagnostic/fix scripts can
+    # load the environment through the bytecode cache
+    try:
+        from env_utils import compile_env
+        compile_env(env_file)
+    except Exception as e:
+        print(f"⚠️  Could not compile .env: {e}")
     
     # Check for Gemini API key
     gemini_key = os.getenv('GEMINI_API_KEY')
@@ -36,10 +54,16 @@ def setup_environment():
         print("✅ Gemini API key configured!")
         print("\n🔧 Running AI diagnostics...")
         try:
-            import subprocess
-            result = subprocess.run(['python', 'diagnose_ai.py'], 
-                                  capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
+            # Run diagnostics in-process - spawning a fresh interpreter would
+            # pay Python startup plus a re-import of google.generativeai
+            import io
+            import contextlib
+            import diagnose_ai
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                # Fast mode: setup only needs to know the key is usable
+                diagnostics_ok = diagnose_ai.main(fast=True)
+            if diagnostics_ok:
                 print("✅ AI diagnostics passed!")
             else:
                 print("⚠️  AI diagnostics found issues. Run 'python diagnose_ai.py' for details.")
@@ -52,23 +76,21 @@ def setup_environment():
     print("   python fix_ai.py        # Auto-fix AI issues")
 
 def create_env_file(file_path):
-    """Create a .env file with template configuration"""
-    template = """# SkillSync AI Configuration
-# Get your free Gemini API key from: https://makersuite.google.com/app/apikey
-
-GEMINI_API_KEY=your_gemini_api_key_here
-
-# Optional: Set environment mode
-ENVIRONMENT=development
+    """Create a .env file with template configuration.
 
-# Note: SkillSync works in demo mode without the API key
-# AI features will be simulated with high-quality fallback responses
-"""
-    
+    Uses O_EXCL so an existing file is never clobbered, and 0o600 perms
+    since the file will hold an API key. Writes the template with one
+    os.write instead of going through a buffered text-mode writer.
+    """
     try:
-        with open(file_path, 'w') as f:
-            f.write(template)
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.write(fd, _ENV_TEMPLATE)
+        finally:
+            os.close(fd)
         print(f"✅ Created {file_path}")
+    except FileExistsError:
+        print("✅ .env file already exists")
     except Exception as e:
         print(f"❌ Error creating .env file: {e}")
 
@@ -0,0 +1,151 @@
+"""
+SkillSync Environment Helpers
+
+Fast .env loading for the diagnostic/fix scripts. The .env file rarely
+changes, so we cache the parsed values keyed by (mtime, size) and skip
+dotenv's parser entirely when the file is unchanged.
+"""
+
+import os
+import pickle
+
+# Cache file lives alongside other per-user caches
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'skillsync')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'dotenv.pkl')
+
+def _default_env_path():
+    """Path to the backend .env file"""
+    return os.path.join(os.path.dirname(__file__), '.env')
+
+def _parse_env(path):
+    """Parse a simple KEY=VALUE .env file into a dict.
+
+    Our .env files are a handful of flat assignments, so a split-based
+    parser is plenty - and much cheaper than dotenv's full tokenizer.
+    Multi-line values and variable expansion are deliberately not
+    supported.
+    """
+    parsed = {}
+    with open(path, 'rb') as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line.startswith(b'#') or b'=' not in line:
+                continue
+            key, _, value = line.partition(b'=')
+            parsed[key.strip().decode()] = value.strip().strip(b'"\'').decode()
+    return parsed
+
+# Name of the compiled env module emitted by compile_env()
+_COMPILED_NAME = '_env_compiled.py'
+
+def compile_env(src=None, dst=None):
+    """Compile .env into an importable _env_compiled.py module.
+
+    Importing the compiled module hits Python's bytecode cache (the
+    .pyc under __pycache__), so repeated script invocations load the
+    environment without parsing anything. Recompiles only when .env is
+    newer than the compiled module. Returns True if a current compiled
+    module exists afterwards.
+    """
+    if src is None:
+        src = _default_env_path()
+    if dst is None:
+        dst = os.path.join(os.path.dirname(__file__), _COMPILED_NAME)
+
+    try:
+        src_mtime = os.stat(src).st_mtime_ns
+    except OSError:
+        return False
+
+    try:
+        if os.stat(dst).st_mtime_ns >= src_mtime:
+            return True  # Already current
+    except OSError:
+        pass
+
+    parsed = _parse_env(src)
+    tmp_path = dst + '.tmp'
+    # The compiled module holds the API key - keep it owner-only like
+    # the 0o600 .env it was generated from
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(fd, 'w') as f:
+        f.write('# Generated from .env by env_utils.compile_env - do not edit\n')
+        f.write('ENV = ' + repr(parsed) + '\n')
+    os.replace(tmp_path, dst)
+    return True
+
+def _load_compiled(env_path):
+    """Import _env_compiled.ENV if it exists and is newer than .env"""
+    compiled = os.path.join(os.path.dirname(os.path.abspath(env_path)), _COMPILED_NAME)
+    try:
+        if os.stat(compiled).st_mtime_ns < os.stat(env_path).st_mtime_ns:
+            return None  # Stale - fall back to parsing
+    except OSError:
+        return None
+    try:
+        from _env_compiled import ENV
+        return ENV
+    except ImportError:
+        return None
+
+def load_dotenv_cached(path=None):
+    """
+    Load environment variables from .env, skipping the parse when the
+    file hasn't changed since the last run.
+
+    Drop-in replacement for dotenv.load_dotenv() for our simple .env
+    files. Returns True if values were loaded (from cache or disk).
+    """
+    if path is None:
+        path = _default_env_path()
+
+    # Fastest path: a current compiled module loads via the .pyc cache
+    compiled_env = _load_compiled(path)
+    if compiled_env is not None:
+        for key, value in compiled_env.items():
+            os.environ.setdefault(key, value)
+        return True
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    # Try the cache first
+    cache = {}
+    try:
+        with open(_CACHE_FILE, 'rb') as f:
+            cache = pickle.load(f)
+        cached_stamp, parsed = cache[path]
+        if cached_stamp == stamp:
+            for key, value in parsed.items():
+                os.environ.setdefault(key, value)
+            return True
+    except Exception:
+        # A corrupted cache (truncated pickle raises EOFError, garbage
+        # bytes can raise almost anything) must never break startup -
+        # fall through and reparse
+        pass
+
+    # Cache miss - parse the file and refresh the cache
+    parsed = _parse_env(path)
+
+    for key, value in parsed.items():
+        os.environ.setdefault(key, value)
+
+    try:
+        # The pickle holds the parsed key too, so the cache dir and
+        # file stay owner-only
+        os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+        cache[path] = (stamp, parsed)
+        tmp_path = _CACHE_FILE + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'wb') as f:
+            pickle.dump(cache, f)
+        os.replace(tmp_path, _CACHE_FILE)
+    except OSError:
+        pass  # Cache write failures are harmless - next run just reparses
+
+    return True
@@ -1,122 +1,234 @@
-#!/usr/bin/env python3
-"""
-SkillSync AI Quick Fix
-
-This script automatically fixes common Gemini AI issues.
-"""
-
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-def auto_fix_gemini():
-    """Automatically detect and fix Gemini model issues"""
-    print("🔧 SkillSync AI Quick Fix")
-    print("=" * 40)
-    
-    api_key = os.getenv('GEMINI_API_KEY')
-    if not api_key:
-        print("❌ No API key found")
-        print("Please add GEMINI_API_KEY to your .env file")
-        return False
-    
-    try:
-        import google.generativeai as genai
-        genai.configure(api_key=api_key)
-        
-        print("🔍 Finding working model...")
-        
-        # Modern model names first
-        model_candidates = [
-            'gemini-1.5-flash-latest',
-            'gemini-1.5-flash', 
-            'gemini-1.5-pro-latest',
-            'gemini-1.5-pro',
-            'gemini-pro-latest',
-            'gemini-pro'
-        ]
-        
-        working_model = None
-        
-        for model_name in model_candidates:
-            try:
-                print(f"  Testing {model_name}...")
-                model = genai.GenerativeModel(model_name)
-                
-                # Quick test
-                response = model.generate_content("Say 'OK' if you're working")
-                if response and response.text:
-                    print(f"  ✅ {model_name} works!")
-                    working_model = model_name
-                    break
-                    
-            except Exception as e:
-                print(f"  ❌ {model_name}: {str(e)[:50]}...")
-                continue
-        
-        if working_model:
-            print(f"\n🎉 Found working model: {working_model}")
-            
-            # Update ai_utils.py with the working model
-            update_ai_utils(working_model)
-            return True
-        else:
-            print("\n❌ No working models found")
-            print("Try updating google-generativeai:")
-            print("pip install --upgrade google-generativeai")
-            return False
-            
-    except ImportError:
-        print("❌ google-generativeai not installed")
-        print("Install with: pip install google-generativeai")
-        return False
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return False
-
-def update_ai_utils(working_model):
-    """Update ai_utils.py with the working model"""
-    try:
-        ai_utils_path = 'ai_utils.py'
-        
-        if not os.path.exists(ai_utils_path):
-            print(f"⚠️  {ai_utils_path} not found in current directory")
-            return
-        
-        with open(ai_utils_path, 'r') as f:
-            content = f.read()
-        
-        # Simple replacement of the model initialization
-        updated_content = content.replace(
-            "model = genai.GenerativeModel(model_name)",
-            f"model = genai.GenerativeModel('{working_model}')"
-        )
-        
-        with open(ai_utils_path, 'w') as f:
-            f.write(updated_content)
-        
-        print(f"✅ Updated ai_utils.py to use {working_model}")
-        
-    except Exception as e:
-        print(f"⚠️  Could not update ai_utils.py: {e}")
-
-def main():
-    """Run the auto-fix"""
-    success = auto_fix_gemini()
-    
-    print("\n" + "=" * 40)
-    if success:
-        print("🎉 AI fix complete!")
-        print("\nNext steps:")
-        print("1. Restart your backend: python app.py") 
-        print("2. Test the AI features")
-    else:
-        print("❌ Auto-fix failed")
-        print("\nManual steps:")
-        print("1. Check your API key")
-        print("2. Update packages: pip install --upgrade google-generativeai")
-        print("3. Run diagnostics: python diagnose_ai.py")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+SkillSync AI Quick Fix
+
+This script automatically fixes common Gemini AI issues.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+from env_utils import load_dotenv_cached
+
+load_dotenv_cached()
+
+# Cache the API key once at import so repeated lookups skip os.environ
+_GEMINI_KEY = os.environ.get('GEMINI_API_KEY')
+
+# Modern model names first; built once at import instead of per call
+_MODEL_CANDIDATES = (
+    'gemini-1.5-flash-latest',
+    'gemini-1.5-flash',
+    'gemini-1.5-pro-latest',
+    'gemini-1.5-pro',
+    'gemini-pro-latest',
+    'gemini-pro'
+)
+
+# The working model rarely changes between runs, so remember it per API key
+_MODEL_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'skillsync', 'working_model.json')
+
+def _model_cache_key(api_key):
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+def _load_cached_model(api_key):
+    """Return the last known working model for this API key, if any"""
+    try:
+        with open(_MODEL_CACHE_FILE) as f:
+            return json.load(f).get(_model_cache_key(api_key))
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_model(api_key, model_name):
+    """Persist the working model so the next run skips the full probe"""
+    try:
+        cache = {}
+        try:
+            with open(_MODEL_CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            pass
+        cache[_model_cache_key(api_key)] = model_name
+        os.makedirs(os.path.dirname(_MODEL_CACHE_FILE), exist_ok=True)
+        tmp_path = _MODEL_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, _MODEL_CACHE_FILE)
+    except OSError:
+        pass  # Cache is best-effort - next run just reprobes
+
+def auto_fix_gemini():
+    """Automatically detect and fix Gemini model issues"""
+    print("🔧 SkillSync AI Quick Fix")
+    print("=" * 40)
+    
+    api_key = _GEMINI_KEY
+    if not api_key:
+        print("❌ No API key found")
+        print("Please add GEMINI_API_KEY to your .env file")
+        return False
+    
+    try:
+        # Shared lazy import - loads google.generativeai once per process
+        from _genai_cache import genai
+        genai().configure(api_key=api_key)
+        
+        print("🔍 Finding working model...")
+
+        working_model = None
+
+        def probe_model(model_name):
+            from _genai_cache import get_model
+            model = get_model(model_name)
+            # Quick test - 1 deterministic token caps latency at the
+            # round-trip floor, and a timeout bounds hung candidates
+            response = model.generate_content(
+                "ok",
+                generation_config=genai().GenerationConfig(max_output_tokens=1, temperature=0.0),
+                request_options={'timeout': 5}
+            )
+            if response is None:
+                raise Exception("empty response")
+            return model_name
+
+        # Collect (name, ok, detail) per attempt and render one report at
+        # the end, so output isn't serialized behind slow HTTPS calls
+        results = []
+
+        # Try the model that worked last time before probing anything else
+        cached_model = _load_cached_model(api_key)
+        if cached_model:
+            try:
+                probe_model(cached_model)
+                results.append((cached_model, True, "works! (cached)"))
+                working_model = cached_model
+            except Exception as e:
+                results.append((cached_model, False, f"cached: {str(e)[:50]}..."))
+
+        if working_model is None:
+            # One list_models() walk is authoritative about which candidates
+            # support generateContent - much cheaper than probing all six.
+            # resolve_candidates stops paginating once every candidate is
+            # seen and shares its cache with diagnose_ai.
+            try:
+                from _genai_cache import resolve_candidates
+                available = resolve_candidates(_MODEL_CANDIDATES)
+            except Exception as e:
+                results.append(("list_models", False, str(e)[:50] + "..."))
+                available = set()
+
+            if available:
+                for model_name in _MODEL_CANDIDATES:
+                    if model_name in available:
+                        try:
+                            # Single confirming round-trip on the chosen model
+                            probe_model(model_name)
+                            results.append((model_name, True, "works!"))
+                            working_model = model_name
+                            break
+                        except Exception as e:
+                            results.append((model_name, False, f"{str(e)[:50]}..."))
+            else:
+                # Listing failed - probe all candidates concurrently and take
+                # the first success in preference order
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=len(_MODEL_CANDIDATES)) as executor:
+                    futures = {name: executor.submit(probe_model, name) for name in _MODEL_CANDIDATES}
+                    for model_name in _MODEL_CANDIDATES:
+                        try:
+                            futures[model_name].result()
+                            results.append((model_name, True, "works!"))
+                            working_model = model_name
+                            break
+                        except Exception as e:
+                            results.append((model_name, False, f"{str(e)[:50]}..."))
+
+                    # Don't wait on probes we no longer need
+                    for future in futures.values():
+                        future.cancel()
+
+        sys.stdout.write('\n'.join(
+            f"  {'✅' if ok else '❌'} {name}: {detail}" for name, ok, detail in results
+        ) + '\n')
+        
+        if working_model:
+            print(f"\n🎉 Found working model: {working_model}")
+            _store_cached_model(api_key, working_model)
+
+            # Update ai_utils.py with the working model
+            update_ai_utils(working_model)
+            return True
+        else:
+            print("\n❌ No working models found")
+            print("Try updating google-generativeai:")
+            print("pip install --upgrade google-generativeai")
+            return False
+            
+    except ImportError:
+        print("❌ google-generativeai not installed")
+        print("Install with: pip install google-generativeai")
+        return False
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+# Compiled once so repeated fix runs don't rebuild the pattern
+_MODEL_LINE_RE = re.compile(rb"model = genai\.GenerativeModel\([^)]*\)")
+
+def update_ai_utils(working_model):
+    """Update ai_utils.py with the working model"""
+    try:
+        ai_utils_path = 'ai_utils.py'
+        
+        if not os.path.exists(ai_utils_path):
+            print(f"⚠️  {ai_utils_path} not found in current directory")
+            return
+        
+        replacement = f"model = genai.GenerativeModel('{working_model}')".encode()
+
+        # Scan through an mmap so the regex searches the file in place
+        # instead of first copying it into a Python string; new content is
+        # only materialized when something actually changes
+        with open(ai_utils_path, 'r+b') as f:
+            with mmap.mmap(f.fileno(), 0) as mm:
+                match = _MODEL_LINE_RE.search(mm)
+                if match is None:
+                    print(f"⚠️  No GenerativeModel call found in {ai_utils_path}")
+                    return
+                if mm[match.start():match.end()] == replacement:
+                    # Already configured - skip the write so we don't bump
+                    # the file's mtime (and invalidate caches) for nothing
+                    print(f"✅ ai_utils.py already uses {working_model}")
+                    return
+                updated_content = mm[:match.start()] + replacement + mm[match.end():]
+            f.seek(0)
+            f.write(updated_content)
+            f.truncate()
+
+        print(f"✅ Updated ai_utils.py to use {working_model}")
+        
+    except Exception as e:
+        print(f"⚠️  Could not update ai_utils.py: {e}")
+
+def main():
+    """Run the auto-fix"""
+    success = auto_fix_gemini()
+    
+    print("\n" + "=" * 40)
+    if success:
+        print("🎉 AI fix complete!")
+        print("\nNext steps:")
+        print("1. Restart your backend: python app.py") 
+        print("2. Test the AI features")
+    else:
+        print("❌ Auto-fix failed")
+        print("\nManual steps:")
+        print("1. Check your API key")
+        print("2. Update packages: pip install --upgrade google-generativeai")
+        print("3. Run diagnostics: python diagnose_ai.py")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -15,6 +15,13 @@ import requests
 import tempfile
 from pathlib import Path
 
+# One pooled session for every request in the script - keep-alive means
+# each test after the first skips the TCP handshake entirely
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 def test_video_utilities():
     """Test the video processing utilities"""
     print("🧪 Testing Video Processing Utilities")
@@ -85,7 +92,7 @@ def test_backend_server():
     print("=" * 50)
     
     try:
-        response = requests.get('http://127.0.0.1:5000/', timeout=5)
+        response = SESSION.get('http://127.0.0.1:5000/', timeout=5)
         if response.status_code == 200:
             print("✅ Backend server is running")
             return True
@@ -111,7 +118,7 @@ def test_api_endpoint_audio():
         # Test the API endpoint
         with open(temp_file_path, 'rb') as f:
             files = {'interview': ('test_audio.wav', f, 'audio/wav')}
-            response = requests.post('http://127.0.0.1:5000/analyze-interview', files=files, timeout=30)
+            response = SESSION.post('http://127.0.0.1:5000/analyze-interview', files=files, timeout=30)
         
         # Clean up
         os.unlink(temp_file_path)
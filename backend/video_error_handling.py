@@ -5,9 +5,17 @@ This module provides robust error handling for video processing operations.
 It includes validation, recovery mechanisms, and user-friendly error messages.
 """
 
+import json
 import os
 import logging
-from pathlib import Path
+import threading
+import time
+
+from video_utils import (
+    SUPPORTED_VIDEO_FORMATS,
+    SUPPORTED_VIDEO_FORMAT_SET,
+    file_suffix
+)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -25,43 +33,91 @@ class AudioExtractionError(VideoProcessingError):
     """Raised when audio extraction fails"""
     pass
 
-def validate_video_file(file_path, max_size_mb=100, max_duration_seconds=600):
+# Successful validations are cached for a short window keyed by
+# (absolute path, size, mtime), so re-validating the same upload within
+# one request costs a dict lookup instead of another container probe.
+# Hand-rolled TTL dict - the project has no cachetools dependency.
+_VALIDATION_CACHE = {}
+_VALIDATION_CACHE_LOCK = threading.Lock()
+_VALIDATION_CACHE_TTL = 60.0
+_VALIDATION_CACHE_LIMIT = 1024
+
+def _validation_cache_get(key):
+    """Return a cached validation dict, or None on miss/expiry"""
+    with _VALIDATION_CACHE_LOCK:
+        entry = _VALIDATION_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.time() - stored_at > _VALIDATION_CACHE_TTL:
+            del _VALIDATION_CACHE[key]
+            return None
+        return dict(result)
+
+def _validation_cache_put(key, result):
+    """Store a validation dict, evicting expired/oldest entries"""
+    now = time.time()
+    with _VALIDATION_CACHE_LOCK:
+        if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_LIMIT:
+            expired = [k for k, (t, _) in _VALIDATION_CACHE.items()
+                       if now - t > _VALIDATION_CACHE_TTL]
+            for k in expired:
+                del _VALIDATION_CACHE[k]
+            while len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_LIMIT:
+                oldest = min(_VALIDATION_CACHE, key=lambda k: _VALIDATION_CACHE[k][0])
+                del _VALIDATION_CACHE[oldest]
+        _VALIDATION_CACHE[key] = (now, dict(result))
+
+async def validate_video_file_async(file_path, max_size_mb=100, max_duration_seconds=600):
     """
-    Comprehensive video file validation
-    
+    Comprehensive video file validation without blocking the event loop
+
+    A single os.stat covers existence and size in one syscall, and the
+    metadata probe runs off the loop in a worker thread - so a request
+    validating many files can keep them all in flight concurrently.
+
     Args:
         file_path (str): Path to the video file
         max_size_mb (int): Maximum file size in MB
         max_duration_seconds (int): Maximum duration in seconds
-        
+
     Returns:
         dict: Validation result with details
-        
+
     Raises:
         VideoValidationError: If validation fails
     """
+    import asyncio
+
     try:
-        # Check if file exists
-        if not os.path.exists(file_path):
+        # One stat answers both existence and size
+        try:
+            st = await asyncio.to_thread(os.stat, file_path)
+        except OSError:
             raise VideoValidationError(f"Video file not found: {file_path}")
-        
-        # Check file size
-        file_size_bytes = os.path.getsize(file_path)
-        file_size_mb = file_size_bytes / (1024 * 1024)
-        
+
+        # One file version validates the same way every time, so a
+        # recent successful result is served straight from the cache
+        cache_key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns,
+                     max_size_mb, max_duration_seconds)
+        cached = _validation_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        file_size_mb = st.st_size / (1024 * 1024)
+
         if file_size_mb > max_size_mb:
             raise VideoValidationError(
                 f"Video file too large: {file_size_mb:.1f}MB (max: {max_size_mb}MB)"
             )
         
-        # Check file extension
-        file_ext = Path(file_path).suffix.lower()
-        supported_formats = ['.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv', '.m4v']
-        
-        if file_ext not in supported_formats:
+        # Check file extension - one hash lookup against the shared set
+        file_ext = file_suffix(file_path)
+
+        if file_ext not in SUPPORTED_VIDEO_FORMAT_SET:
             raise VideoValidationError(
                 f"Unsupported video format: {file_ext}. "
-                f"Supported formats: {', '.join(supported_formats)}"
+                f"Supported formats: {', '.join(SUPPORTED_VIDEO_FORMATS)}"
             )
         
         # Try to get video info (requires video processing libraries)
@@ -77,8 +133,10 @@ def validate_video_file(file_path, max_size_mb=100, max_duration_seconds=600):
                     "warning": "Advanced validation skipped - video libraries not available"
                 }
             
-            video_info = get_video_info(file_path)
-            
+            # Reuse the stat from above so the probe's cache key
+            # doesn't cost a second syscall
+            video_info = await asyncio.to_thread(get_video_info, file_path, st)
+
             if "error" in video_info:
                 raise VideoValidationError(f"Video file corrupted or unreadable: {video_info['error']}")
             
@@ -97,15 +155,20 @@ def validate_video_file(file_path, max_size_mb=100, max_duration_seconds=600):
             if resolution[0] < 240 or resolution[1] < 240:
                 logger.warning(f"Low video resolution: {resolution[0]}x{resolution[1]}")
             
-            return {
+            result = {
                 "valid": True,
                 "file_size_mb": file_size_mb,
                 "duration": duration,
                 "resolution": resolution,
                 "format": file_ext,
-                "fps": video_info.get("fps", 0)
+                "fps": video_info.get("fps", 0),
+                # Carried through so the processing pipeline's
+                # muted-video early reject fires off this same probe
+                "has_audio": video_info.get("has_audio")
             }
-            
+            _validation_cache_put(cache_key, result)
+            return result
+
         except ImportError:
             # Fallback to basic validation
             return {
@@ -120,6 +183,54 @@ def validate_video_file(file_path, max_size_mb=100, max_duration_seconds=600):
     except Exception as e:
         raise VideoValidationError(f"Validation failed: {str(e)}")
 
+def validate_video_file(file_path, max_size_mb=100, max_duration_seconds=600):
+    """
+    Sync adapter around validate_video_file_async for blocking callers
+
+    Args:
+        file_path (str): Path to the video file
+        max_size_mb (int): Maximum file size in MB
+        max_duration_seconds (int): Maximum duration in seconds
+
+    Returns:
+        dict: Validation result with details
+
+    Raises:
+        VideoValidationError: If validation fails
+    """
+    import asyncio
+    return asyncio.run(
+        validate_video_file_async(file_path, max_size_mb, max_duration_seconds)
+    )
+
+def should_retry(exc):
+    """
+    Whether a processing failure is plausibly transient
+
+    Validation failures and missing files never get better on a retry
+    - they just burn worker time and backoff sleeps. I/O errors,
+    subprocess timeouts and ffmpeg failures can succeed on a second
+    attempt.
+
+    Args:
+        exc (Exception): The exception raised by a processing attempt
+
+    Returns:
+        bool: True if another attempt is worth making
+    """
+    import subprocess
+
+    if isinstance(exc, (VideoValidationError, FileNotFoundError)):
+        return False
+    if isinstance(exc, subprocess.TimeoutExpired):
+        return True
+    if isinstance(exc, subprocess.CalledProcessError):
+        # Exit status alone can't separate malformed input from
+        # transient resource trouble (a negative code just means
+        # killed by a signal), so ffmpeg failures stay retryable
+        return True
+    return isinstance(exc, OSError)
+
 def safe_video_processing(file_path, max_retries=2):
     """
     Process video with error handling and retry logic
@@ -145,8 +256,11 @@ def safe_video_processing(file_path, max_retries=2):
         for attempt in range(max_retries + 1):
             try:
                 logger.info(f"Video processing attempt {attempt + 1}/{max_retries + 1}")
-                
-                result = process_video_for_interview_analysis(file_path)
+
+                # Validation already probed the file - hand its metadata
+                # through so processing doesn't reopen the container
+                probe = validation_result if "duration" in validation_result else None
+                result = process_video_for_interview_analysis(file_path, video_info=probe)
                 
                 if result["success"]:
                     logger.info("Video processing successful")
@@ -159,15 +273,30 @@ def safe_video_processing(file_path, max_retries=2):
                 else:
                     last_error = result.get("error", "Unknown processing error")
                     logger.warning(f"Processing attempt {attempt + 1} failed: {last_error}")
+
+                    # A missing audio track won't appear on retry -
+                    # either our own early reject or MoviePy tripping
+                    # over the absent audio clip ('NoneType' ...
+                    # write_audiofile)
+                    if ("no audio track" in last_error.lower()
+                            or "write_audiofile" in last_error):
+                        break
                     
             except Exception as e:
                 last_error = str(e)
                 logger.warning(f"Processing attempt {attempt + 1} crashed: {last_error}")
-                
-                # If this is not the last attempt, wait briefly before retry
+
+                # Deterministic failures fail fast instead of eating
+                # the remaining attempts and their backoff sleeps
+                if not should_retry(e):
+                    logger.info("Error is not retryable - giving up immediately")
+                    break
+
+                # If this is not the last attempt, back off exponentially
+                # (0.25s, 0.5s, 1s, ...) so transient failures retry fast
+                # without hammering a struggling system
                 if attempt < max_retries:
-                    import time
-                    time.sleep(1)
+                    time.sleep(0.25 * 2 ** attempt)
         
         # All attempts failed
         raise AudioExtractionError(f"Video processing failed after {max_retries + 1} attempts: {last_error}")
@@ -195,6 +324,65 @@ def safe_video_processing(file_path, max_retries=2):
             "user_message": "An unexpected error occurred during video processing."
         }
 
+def _append_batch_log(log_path, file_path, result):
+    """Append one JSONL record for a finished batch entry.
+
+    Logging is best-effort: a full disk or bad path never fails the
+    batch itself.
+    """
+    try:
+        record = {
+            "file": os.path.basename(file_path),
+            "success": result.get("success", False),
+            "error": result.get("error"),
+            "timestamp": time.time()
+        }
+        with open(log_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+    except OSError as e:
+        logger.warning(f"Could not append batch log entry: {e}")
+
+def process_videos_batch(file_paths, max_workers=5, log_path=None):
+    """
+    Process a batch of video files concurrently with per-file retries
+
+    ffmpeg does the real work in subprocesses, so a thread pool is
+    enough for throughput to scale with min(files, cores). When
+    log_path is given, each result is appended to a JSONL log the
+    moment it completes, so a crash loses at most the in-flight files.
+
+    Args:
+        file_paths (list): Paths to the video files
+        max_workers (int): Maximum concurrent files
+        log_path (str): Optional JSONL file to append results to
+
+    Returns:
+        list: Per-file results from safe_video_processing, in input order
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(safe_video_processing, path): path
+                   for path in file_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Unexpected batch error for {path}: {e}")
+                result = {
+                    "success": False,
+                    "error": str(e),
+                    "error_type": "unexpected",
+                    "user_message": "An unexpected error occurred during video processing."
+                }
+            results[path] = result
+            if log_path:
+                _append_batch_log(log_path, path, result)
+
+    return [results[path] for path in file_paths]
+
 def get_user_friendly_error(error_type, error_message):
     """
     Convert technical errors to user-friendly messages